@@ -0,0 +1,33 @@
+"""
+Compile .env into an importable env_cache module
+
+python-dotenv re-tokenizes the .env file on every start. Running this once
+at deploy time writes env_cache.py instead, whose cached bytecode loads in
+microseconds; main.py imports it when present and only falls back to the
+dotenv parser when it is missing. Re-run after editing .env:
+
+    python compile_env.py
+"""
+
+from dotenv import dotenv_values
+
+
+def main():
+    values = {k: v for k, v in dotenv_values().items() if v is not None}
+
+    lines = [
+        "# Generated by compile_env.py - do not edit, re-run after changing .env",
+        "ENV = {",
+    ]
+    for key, value in values.items():
+        lines.append(f"    {key!r}: {value!r},")
+    lines.append("}")
+
+    with open("env_cache.py", "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    print(f"✅ Wrote env_cache.py with {len(values)} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,22 +9,199 @@ This bot provides:
 4. Rich Discord embeds for better user experience
 """
 
-import discord
-from discord.ext import commands, tasks
-import requests
 import json
 import os
+import re
+import signal
+import sys
 import asyncio
-from datetime import datetime, timedelta
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Load environment variables: prefer the env_cache module precompiled by
+# compile_env.py (bytecode-cached, no file tokenizing), fall back to
+# parsing .env with python-dotenv when it hasn't been generated
+try:
+    from env_cache import ENV as _ENV
+    for _key, _value in _ENV.items():
+        os.environ.setdefault(_key, _value)
+except ImportError:
+    load_dotenv()
+
+# Verbose logging toggle from .env (DEBUG=True), read once like the
+# rest of the configuration
+DEBUG = os.getenv('DEBUG', '').lower() in ('1', 'true', 'yes')
+
+# Configure logging to help with debugging. Records are pushed onto a
+# queue and written out by a background thread, so the event loop never
+# waits on a stream flush.
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+# Drain anything still queued when the process exits
+atexit.register(_log_listener.stop)
+logging.basicConfig(
+    level=logging.DEBUG if DEBUG else logging.INFO,
+    handlers=[QueueHandler(_log_queue)]
+)
+logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
+# Bot configuration, read once at import time instead of per-call
+DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
+DJANGO_API_URL = os.getenv('DJANGO_API_URL', '').rstrip('/')
+BOT_PREFIX = os.getenv('BOT_PREFIX', '!')
+
+# Optional service token for the bulk triggered-alerts endpoint. When set,
+# the monitor fetches every user's triggered alerts in one round-trip
+# instead of one request per logged-in user.
+BOT_SERVICE_TOKEN = os.getenv('BOT_SERVICE_TOKEN')
+
+# Fail fast on missing configuration before paying for the discord and
+# aiohttp imports below (the bulk of module import time) - a misconfigured
+# launch aborts in milliseconds instead of after the full import chain
+if __name__ == "__main__" and not (DISCORD_BOT_TOKEN and DJANGO_API_URL):
+    sys.stderr.write(
+        "❌ Missing configuration! Please check your .env file contains:\n"
+        "   - DISCORD_BOT_TOKEN=your_bot_token\n"
+        "   - DJANGO_API_URL=your_aws_url\n"
+    )
+    sys.exit(1)
 
-# Configure logging to help with debugging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+import discord
+from discord.ext import commands, tasks
+import aiohttp
+
+# API endpoint paths, relative to DJANGO_API_URL (the shared aiohttp
+# session uses it as base_url)
+API_REGISTER = "/api/auth/register/"
+API_LOGIN = "/api/auth/login/"
+API_ALERTS = "/api/alerts/"
+API_ALERTS_TRIGGERED = "/api/alerts/triggered/"
+API_ALERTS_SUMMARY = "/api/alerts/summary/"
+API_ALERTS_TRIGGERED_BULK = "/api/alerts/triggered/bulk/"
+API_STOCKS = "/api/stocks/"
+API_STOCKS_REFRESH = "/api/stocks/refresh_prices/"
+
+# How long cached API responses stay fresh (seconds)
+API_CACHE_TTL = 15
+
+# Stock prices only move on the refresh cadence, so the shared /api/stocks/
+# payload can be cached a little longer than per-user responses
+STOCKS_CACHE_TTL = 30
+
+# Retry policy for rate-limited (429) API responses: honor the server's
+# Retry-After when given, otherwise back off exponentially with jitter
+RETRY_MAX_ATTEMPTS = 8
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+# Circuit breaker for backend outages: after this many consecutive
+# connection failures, API calls fail fast for the cooldown window
+# instead of each paying a full timeout against a dead host
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+
+# Lookup tables for command argument handling - a single hash probe
+# instead of a branch chain or linear scan
+_ALERT_FILTERS = {
+    "triggered": (API_ALERTS_TRIGGERED, "🚨 Your Triggered Alerts", "No triggered alerts found", 0xff0000),
+    "active": (API_ALERTS, "🟢 Your Active Alerts", "No active alerts found", 0x00ff00),
+    "all": (API_ALERTS, "📈 All Your Stock Alerts", "No alerts found", 0x3498db)
+}
+_VALID_CONDITIONS = frozenset({'>', '<', '>=', '<=', '=='})
+
+# Optional C JSON codecs, 3-5x faster than stdlib json on API payloads.
+# msgspec decodes raw UTF-8 to Python objects in a single C pass and is
+# preferred; orjson is next, stdlib json is the fallback.
+try:
+    import msgspec.json
+    _json_loads = msgspec.json.decode
+except ImportError:
+    try:
+        import orjson
+        _json_loads = orjson.loads
+    except ImportError:
+        _json_loads = json.loads
+
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_dumps = json.dumps
+
+@dataclass(slots=True)
+class UserSession:
+    """
+    Per-user login state, kept in memory for the lifetime of the session.
+    Slots keep the per-user footprint small and make field access a fixed
+    offset lookup instead of a dict probe.
+    """
+    access_token: str
+    refresh_token: str
+    username: str
+    connected_at: datetime
+    # time.monotonic() stamp of the last alert notification - a plain float
+    # is cheaper than datetime arithmetic and immune to wall-clock jumps
+    last_alert_check: float
+    auth_headers: dict
+    alert_channel_id: int
+    # Alert ids already notified for this session - duplicate triggers are
+    # filtered out even if the API keeps returning the same rows
+    last_notified_ids: set = field(default_factory=set)
+
+try:
+    # Optional C parser, ~20-50x faster than datetime.fromisoformat
+    import ciso8601
+    _parse_iso = ciso8601.parse_datetime
+except ImportError:
+    def _parse_iso(value):
+        """
+        Parse an ISO-8601 timestamp as produced by the Django API
+        """
+        try:
+            # Python 3.11+ accepts the 'Z' suffix directly
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def _format_alert(alert):
+    """
+    Build the (name, value) embed field pair for one alert row
+    """
+    stock_symbol = alert.get('stock_symbol') or alert.get('stock') or 'Unknown'
+    status_emoji = "🟢" if alert.get('is_active', True) else "🔴"
+
+    duration = f"\n**Duration:** {d} minutes" if (d := alert.get('duration_minutes')) else ""
+
+    created = ""
+    if ts := alert.get('created_at'):
+        try:
+            created = f"\n**Created:** {_parse_iso(ts).strftime('%m/%d/%Y')}"
+        except ValueError:
+            pass
+
+    triggered = ""
+    if ts := alert.get('triggered_at'):
+        try:
+            triggered = f"\n**Triggered:** {_parse_iso(ts).strftime('%m/%d %H:%M')}"
+        except ValueError:
+            pass
+
+    value = (
+        f"**Type:** {alert.get('alert_type', 'N/A')}\n"
+        f"**Condition:** {alert.get('condition', 'N/A')} ${alert.get('threshold_price', 'N/A')}"
+        f"{duration}{created}{triggered}"
+    )
+    return f"{status_emoji} {stock_symbol}", value
 
 class StockAlertsBot:
     """
@@ -32,10 +209,10 @@ class StockAlertsBot:
     """
     
     def __init__(self):
-        # Bot configuration from environment variables
-        self.bot_token = os.getenv('DISCORD_BOT_TOKEN')
-        self.django_api_url = os.getenv('DJANGO_API_URL', '').rstrip('/')
-        self.bot_prefix = os.getenv('BOT_PREFIX', '!')
+        # Bot configuration from the module-level constants
+        self.bot_token = DISCORD_BOT_TOKEN
+        self.django_api_url = DJANGO_API_URL
+        self.bot_prefix = BOT_PREFIX
         
         # Validate configuration
         if not self.bot_token:
@@ -43,32 +220,417 @@ class StockAlertsBot:
         if not self.django_api_url:
             raise ValueError("❌ DJANGO_API_URL not found! Please check your .env file")
         
-        print(f"🌐 Django API URL: {self.django_api_url}")
-        print(f"🤖 Bot prefix: {self.bot_prefix}")
+        logger.info("🌐 Django API URL: %s", self.django_api_url)
+        logger.info("🤖 Bot prefix: %s", self.bot_prefix)
         
+        # Process start stamp for the uptime footer in !ping
+        self.started_at = datetime.now(timezone.utc)
+
         # Storage for user sessions (in production, use Redis or database)
-        # Format: {discord_user_id: {'access_token': 'token', 'username': 'user', ...}}
+        # Format: {discord_user_id: UserSession} - the alert notification
+        # channel lives on the session object too
         self.user_sessions = {}
+
+        # Short-lived cache of API responses, keyed by (user_id, endpoint).
+        # Bursts of repeated queries from the same user are served from here
+        # instead of paying another HTTPS round-trip.
+        self._api_cache = {}
+
+        # Stock prices are the same for everyone, so they get their own
+        # shared cache slot plus a lock that collapses concurrent !stocks
+        # bursts into a single upstream request
+        self._stocks_cache = (0.0, None)
+        self._stocks_lock = asyncio.Lock()
+
+        # Shared HTTP session for Django API calls (created in on_ready because
+        # it must be bound to the running event loop). Reusing one session keeps
+        # TCP connections and TLS handshakes alive between requests instead of
+        # paying for them on every command.
+        self.session = None
+
+        # Outgoing alert notifications are queued here and drained by a
+        # single worker coroutine, so a burst of triggered alerts is paced
+        # instead of fanning out into Discord rate limits
+        self._notify_queue = asyncio.Queue(maxsize=1000)
+        self._notify_task = None
+
+        # Cap on concurrent monitor polls so a large user base doesn't
+        # flood the Django backend with simultaneous requests
+        self._poll_semaphore = asyncio.Semaphore(16)
+
+        # tasks.loop re-fires on schedule even if the previous tick is
+        # still blocked on slow HTTP; this lock makes overlapping ticks
+        # skip instead of doubling load
+        self._monitor_lock = asyncio.Lock()
+
+        # Circuit-breaker state: consecutive connection failures and when
+        # the breaker last tripped (time.monotonic() stamp)
+        self._breaker_failures = 0
+        self._breaker_opened_at = 0.0
+
+        # Whether the backend exposes the bulk triggered-alerts endpoint;
+        # flipped off on the first 404 so we only probe once. The service
+        # auth header is invariant, so it is built here rather than per poll.
+        self._bulk_poll_supported = bool(BOT_SERVICE_TOKEN)
+        self._service_auth_headers = (
+            {'Authorization': f'Bearer {BOT_SERVICE_TOKEN}'} if BOT_SERVICE_TOKEN else None
+        )
         
-        # Storage for alert channels (where to send notifications)
-        # Format: {discord_user_id: channel_id}
-        self.alert_channels = {}
-        
-        # Set up Discord bot with required intents
-        intents = discord.Intents.default()
-        intents.message_content = True  # Required to read message content
+        # Prebuilt embeds for responses that are constant apart from the bot
+        # prefix - built once here and sent as copies instead of being
+        # reconstructed on every failure path
+        self._embed_not_connected = discord.Embed(
+            title="🔒 Not Connected",
+            description=f"Please login first: `{self.bot_prefix}login <username> <password>`",
+            color=0xff0000
+        )
+        self._embed_session_expired = discord.Embed(
+            title="🔒 Session Expired",
+            description="Your login session has expired.\n\n"
+                        f"Please login again: `{self.bot_prefix}login <username> <password>`",
+            color=0xff0000
+        )
+        self._embed_register_usage = discord.Embed(
+            title="🔐 Register for Stock Alerts",
+            description=f"**Usage:** `{self.bot_prefix}register <username> <password> <email>`\n\n"
+                        "This creates a new account in the AWS stock alerts system.\n"
+                        "⚠️ Your registration message will be deleted for security.",
+            color=0x3498db
+        )
+        self._embed_login_usage = discord.Embed(
+            title="🔐 Login to Stock Alerts",
+            description=f"**Usage:** `{self.bot_prefix}login <username> <password>`\n\n"
+                        "This connects your Discord account to your AWS stock alerts system.\n"
+                        "⚠️ Your login message will be deleted for security.",
+            color=0x3498db
+        )
+        self._embed_timeout = discord.Embed(
+            title="⏰ Connection Timeout",
+            description="The connection to your stock alerts API timed out.\n\n"
+                        "This might mean:\n"
+                        "• Your AWS server is slow to respond\n"
+                        "• Network connectivity issues\n"
+                        "• Your Django app is not running",
+            color=0xff9500
+        )
+        self._embed_connection_error = discord.Embed(
+            title="🌐 Connection Error",
+            description=f"Cannot connect to your stock alerts API.\n\n"
+                        f"**API URL:** `{self.django_api_url}`\n\n"
+                        "Please check:\n"
+                        "• Your AWS Django system is running\n"
+                        "• The API URL in .env is correct\n"
+                        "• Your server allows external connections",
+            color=0xff0000
+        )
+
+        # The alerthelp and start help screens are fully static once the
+        # prefix is known, so they are assembled here instead of on every
+        # invocation (each one is a dozen-plus allocations per build)
+        prefix = self.bot_prefix
+        self._embed_alert_help = discord.Embed(
+            title="🔔 Stock Alert Help",
+            description="Learn how to create stock price alerts",
+            color=0x0099ff
+        )
+        self._embed_alert_help.add_field(
+            name="📝 Basic Usage",
+            value=f"`{prefix}alert <stock_id> <condition> <price> [duration]`",
+            inline=False
+        )
+        self._embed_alert_help.add_field(
+            name="🔢 Parameters",
+            value="""
+            **stock_id**: ID of the stock to monitor
+            **condition**: >, <, >=, <=, ==
+            **price**: Target price (decimal)
+            **duration**: Minutes (optional)
+            """,
+            inline=False
+        )
+        self._embed_alert_help.add_field(
+            name="💡 Examples",
+            value=f"""
+            `{prefix}alert 1 > 150.50` - Alert when stock 1 goes above $150.50
+            `{prefix}alert 2 < 50.00 60` - Alert when stock 2 goes below $50 (1 hour)
+            `{prefix}alert 3 >= 100.25 1440` - Alert when stock 3 reaches $100.25+ (24 hours)
+            """,
+            inline=False
+        )
+        self._embed_alert_help.add_field(
+            name="⏰ Duration",
+            value="If not specified, alert will remain active indefinitely",
+            inline=False
+        )
+
+        self._embed_start = discord.Embed(
+            title="🤖 Stock Alerts Bot - Help",
+            description="Connect to your AWS-deployed Django stock alerts system\n"
+                       f"**Command Prefix:** `{prefix}`",
+            color=0x3498db
+        )
+        self._embed_start.add_field(
+            name="🔐 Authentication",
+            value=f"`{prefix}register <user> <pass>` - Register a new account\n"
+                  f"`{prefix}login <user> <pass>` - Connect to your account\n"
+                  f"`{prefix}logout` - Disconnect from account\n"
+                  f"`{prefix}status` - Check connection status",
+            inline=False
+        )
+        self._embed_start.add_field(
+            name="📈 Stock Alerts",
+            value=f"`{prefix}alert <stock_id> <condition> <price> [duration]` - Create a stock alert\n"
+                  f"`{prefix}alerthelp` - See how to use the create alert command\n"
+                  f"`{prefix}alerts` - Show all your alerts\n"
+                  f"`{prefix}alerts active` - Show only active alerts\n"
+                  f"`{prefix}alerts triggered` - Show triggered alerts",
+            inline=False
+        )
+        self._embed_start.add_field(
+            name="📊 Stock Data",
+            value=f"`{prefix}stocks` - Show current stock prices\n"
+                  f"`{prefix}refresh` - Manually refresh stock prices",
+            inline=False
+        )
+        self._embed_start.add_field(
+            name="ℹ️ Information",
+            value=f"`{prefix}start` - Show this help message\n"
+                  f"`{prefix}ping` - Check bot response time",
+            inline=False
+        )
+        self._embed_start.add_field(
+            name="🚀 Getting Started",
+            value=f"1. Use `{prefix}login <username> <password>`\n"
+                  f"2. Check your alerts with `{prefix}alerts`\n"
+                  f"3. Monitor stock prices with `{prefix}stocks`\n"
+                  f"4. The bot will notify you of triggered alerts automatically!",
+            inline=False
+        )
+
+        # Set up Discord bot with only the intents it actually uses:
+        # guilds for channel lookups, messages + message_content for
+        # commands. No members intent means READY doesn't trigger
+        # per-guild member chunking, and the member cache stays empty
+        # instead of growing with every guild the bot joins.
+        intents = discord.Intents(
+            guilds=True,
+            messages=True,
+            message_content=True  # Required to read message content
+        )
         
         # Create bot instance
         self.bot = commands.Bot(
             command_prefix=self.bot_prefix,
             intents=intents,
+            chunk_guilds_at_startup=False,
+            member_cache_flags=discord.MemberCacheFlags.none(),
+            # Don't let a single REST call sleep out a long rate-limit
+            # bucket; fail it after 30s (the library minimum) instead
+            max_ratelimit_timeout=30.0,
             help_command=None  # We'll create our own help command
         )
         
+        # Create the shared HTTP session inside bot.start(), before the
+        # gateway connects - guarantees it exists by the time the first
+        # command or monitor tick can possibly run
+        async def _setup_hook():
+            self._ensure_session()
+
+        self.bot.setup_hook = _setup_hook
+
+        # Gateway discovery needs no caching here: a plain Bot connects
+        # to discord.py's hardcoded default gateway and reuses the READY
+        # resume_gateway_url on reconnect, so /gateway/bot is never
+        # re-asked per connect (that only happens under AutoShardedClient)
+
         # Initialize bot events and commands
         self.setup_events()
         self.setup_commands()
     
+    def _cache_get(self, user_id, endpoint):
+        """
+        Return a cached API response for (user_id, endpoint) if still fresh
+        """
+        cached = self._api_cache.get((user_id, endpoint))
+        if cached is not None and time.monotonic() - cached[0] < API_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def _cache_put(self, user_id, endpoint, data):
+        """
+        Store an API response in the short-lived cache
+        """
+        self._api_cache[(user_id, endpoint)] = (time.monotonic(), data)
+
+    def _cache_invalidate(self, user_id):
+        """
+        Drop all cached responses for a user (on logout, 401 or alert changes)
+        """
+        for key in [key for key in self._api_cache if key[0] == user_id]:
+            del self._api_cache[key]
+
+    def _err(self, title, description):
+        """
+        Build a red error embed - the one construction path for the many
+        near-identical failure responses across the command handlers
+        """
+        return discord.Embed(title=title, description=description, color=0xff0000)
+
+    async def _fetch_alert_summary(self, user_id, auth_headers):
+        """
+        Fetch the login-time alert summary text (active + triggered counts)
+        """
+        alert_summary = ""
+        try:
+            async with self.session.get(
+                API_ALERTS_SUMMARY,
+                headers=auth_headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as summary_response:
+                if summary_response.status == 200:
+                    summary_json = _json_loads(await summary_response.read())
+                    self._cache_put(user_id, API_ALERTS_SUMMARY, summary_json)
+                    summary_data = summary_json.get('summary', {})
+                    alert_summary = (
+                        f"\n📊 **Your Alert Summary:**\n"
+                        f"• Active alerts: {summary_data.get('active_alerts', 0)}\n"
+                    )
+            if alert_summary:
+                try:
+                    async with self.session.get(
+                        API_ALERTS_TRIGGERED,
+                        headers=auth_headers,
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as triggered_response:
+                        if triggered_response.status == 200:
+                            triggered_data = _json_loads(await triggered_response.read())
+                            alert_summary += f"• Triggered alerts: {triggered_data.get('count', 0)}"
+                except Exception as e:
+                    logger.warning("Could not fetch triggered alerts: %s", e)
+        except Exception as e:
+            logger.warning("Could not fetch alert summary: %s", e)
+        return alert_summary
+
+    async def _get_stocks(self):
+        """
+        Fetch /api/stocks/ through a short TTL cache shared by all users
+
+        Returns (status, payload). Concurrent callers coalesce behind one
+        lock so a burst of !stocks commands costs a single upstream request.
+        """
+        ts, cached = self._stocks_cache
+        if cached is not None and time.monotonic() - ts < STOCKS_CACHE_TTL:
+            return 200, cached
+
+        async with self._stocks_lock:
+            # Re-check after the wait - another caller may have refreshed
+            # the cache while we were queued on the lock
+            ts, cached = self._stocks_cache
+            if cached is not None and time.monotonic() - ts < STOCKS_CACHE_TTL:
+                return 200, cached
+
+            status, body = await self._request_with_backoff("GET", API_STOCKS)
+            data = _json_loads(body) if status == 200 else None
+
+            if status == 200:
+                self._stocks_cache = (time.monotonic(), data)
+            return status, data
+
+    def _ensure_session(self):
+        """
+        Create the shared HTTP session if it doesn't exist yet. Must be
+        called from a coroutine so the session binds to the running loop.
+        """
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                base_url=self.django_api_url,
+                timeout=aiohttp.ClientTimeout(total=15),
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    use_dns_cache=True
+                ),
+                json_serialize=_json_dumps
+            )
+
+    async def _check_django(self):
+        """
+        Probe the Django API while the gateway login proceeds
+
+        Doubles as the HTTP warmup (DNS + TLS handshake primed for the
+        first real call) and as a fast, clearly-logged startup health
+        check when the backend is down. The bot still starts either way -
+        Django being unreachable shouldn't keep Discord commands offline.
+        """
+        self._ensure_session()
+        try:
+            async with self.session.get(
+                API_STOCKS, timeout=aiohttp.ClientTimeout(total=3)
+            ) as response:
+                logger.info(
+                    "Django API reachable at %s (HTTP %s)",
+                    self.django_api_url, response.status
+                )
+        except Exception as e:
+            logger.error(
+                "Django API unreachable at %s: %s - commands will fail "
+                "until it comes back",
+                self.django_api_url, e
+            )
+
+    async def _request_with_backoff(self, method, path, **kwargs):
+        """
+        Issue an API request, retrying 429 responses instead of surfacing
+        them as generic failures
+
+        Waits out the server's Retry-After header when present, otherwise
+        sleeps an exponentially growing delay with jitter, up to
+        RETRY_MAX_ATTEMPTS tries. Returns (status, body) with the raw
+        response bytes so callers can decode with the fast JSON path.
+        """
+        # Fail fast while the circuit breaker is open - during an outage
+        # every handler would otherwise pay a full timeout per call
+        if (self._breaker_failures >= BREAKER_FAILURE_THRESHOLD
+                and time.monotonic() - self._breaker_opened_at < BREAKER_COOLDOWN):
+            raise aiohttp.ClientConnectionError(
+                f"API circuit breaker open; skipping {method} {path}"
+            )
+
+        status = 429
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            try:
+                async with self.session.request(method, path, **kwargs) as response:
+                    status = response.status
+                    if status != 429:
+                        # Any response at all means the backend is reachable
+                        self._breaker_failures = 0
+                        return status, await response.read()
+                    retry_after = response.headers.get("Retry-After")
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+                self._breaker_failures += 1
+                self._breaker_opened_at = time.monotonic()
+                if self._breaker_failures == BREAKER_FAILURE_THRESHOLD:
+                    logger.warning(
+                        "API circuit breaker opened after %s consecutive failures",
+                        self._breaker_failures
+                    )
+                raise
+
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = RETRY_BASE_DELAY * 2 ** attempt
+            delay = min(RETRY_MAX_DELAY, delay) + random.uniform(0, 0.5)
+
+            logger.warning(
+                "Rate limited on %s %s; retrying in %.1fs (attempt %s/%s)",
+                method, path, delay, attempt + 1, RETRY_MAX_ATTEMPTS
+            )
+            await asyncio.sleep(delay)
+
+        return status, b""
+
     def setup_events(self):
         """
         Set up Discord bot events (triggered automatically by Discord)
@@ -79,10 +641,15 @@ class StockAlertsBot:
             """
             Called when bot successfully connects to Discord
             """
-            print(f"🚀 Bot is ready!")
-            print(f"🤖 Logged in as: {self.bot.user}")
-            print(f"📊 Connected to {len(self.bot.guilds)} Discord servers")
-            print(f"🔗 API Endpoint: {self.django_api_url}")
+            logger.info(
+                "🚀 Bot is ready! Logged in as %s, connected to %s Discord "
+                "servers, API endpoint %s",
+                self.bot.user, len(self.bot.guilds), self.django_api_url
+            )
+
+            # Create the shared HTTP session on the bot's event loop
+            # (usually already done by the startup warmup)
+            self._ensure_session()
             
             # Set bot's "activity status" (what users see under the bot's name)
             activity = discord.Activity(
@@ -91,10 +658,14 @@ class StockAlertsBot:
             )
             await self.bot.change_presence(activity=activity)
             
+            # Start the notification worker
+            if self._notify_task is None:
+                self._notify_task = asyncio.create_task(self._notify_worker())
+
             # Start background monitoring task
             if not self.monitor_triggered_alerts.is_running():
                 self.monitor_triggered_alerts.start()
-                print("✅ Background alert monitoring started")
+                logger.info("✅ Background alert monitoring started")
         
         @self.bot.event
         async def on_command_error(ctx, error):
@@ -106,7 +677,7 @@ class StockAlertsBot:
             elif isinstance(error, commands.MissingRequiredArgument):
                 await ctx.send(f"❌ Missing required arguments. Use `{self.bot_prefix}help` for command usage.")
             else:
-                logger.error(f"Command error: {error}")
+                logger.error("Command error: %s", error)
                 await ctx.send("❌ An error occurred while processing your command.")
     
     def setup_commands(self):
@@ -123,20 +694,13 @@ class StockAlertsBot:
             """
 
             if not username or not password or not email:
-                embed = discord.Embed(
-                    title="🔐 Register for Stock Alerts",
-                    description=f"**Usage:** `{self.bot_prefix}register <username> <password> <email>`\n\n"
-                                "This creates a new account in the AWS stock alerts system.\n"
-                                "⚠️ Your registration message will be deleted for security.",
-                    color=0x3498db
-                )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=self._embed_register_usage.copy())
                 return
 
             # Delete the command message for security (contains password)
             try:
                 await ctx.message.delete()
-                print(f"🗑️ Deleted registration message from {ctx.author}")
+                logger.debug("Deleted registration message from %s", ctx.author)
             except discord.errors.NotFound:
                 pass  # Message already deleted
             except discord.errors.Forbidden:
@@ -146,27 +710,26 @@ class StockAlertsBot:
             loading_msg = await ctx.send("🔄 Registering your account...")
             try:
                 # Make API call to your Django registration endpoint
-                register_url = f"{self.django_api_url}/api/auth/register/"
-                print(f"🌐 Attempting registration at: {register_url}")
-
-                response = requests.post(
-                    register_url,
-                    json={"username": username, "password": password, "email": email},
-                    headers={"Content-Type": "application/json"},
-                    timeout=15  # 15 second timeout
-                )
+                logger.debug("Attempting registration at: %s/api/auth/register/", self.django_api_url)
+
+                async with self.session.post(
+                    API_REGISTER,
+                    json={"username": username, "password": password, "email": email}
+                ) as response:
+                    status = response.status
+                    body = await response.text()
 
-                print(f"📡 Registration response status: {response.status_code,},{response.text}")
+                logger.debug("Registration response status: %s, %s", status, body)
 
-                if response.status_code == 201:
+                if status == 201:
                     # Successful registration
                     await ctx.send("✅ Registration successful! You can now log in.")
                 else:
-                    await ctx.send(f"❌ Registration failed, {response.text}")
-                    print(f"❌ Registration failed, {response.text}")
+                    await ctx.send(f"❌ Registration failed, {body}")
+                    logger.warning("Registration failed, %s", body)
 
             except Exception as e:
-                print(f"⚠️ Error during registration: {e}")
+                logger.exception("Error during registration")
                 await ctx.send("❌ An error occurred while registering your account.")
 
         @self.bot.command(name='login', aliases=['connect'])
@@ -175,111 +738,96 @@ class StockAlertsBot:
             Login to your stock alerts account
             Usage: !login <username> <password>
             """
+
+            # Hoist hot lookups to locals for the embed-heavy body below
+            Embed = discord.Embed
+            prefix = self.bot_prefix
+            send = ctx.send
+
             
             # Validate command arguments
             if not username or not password:
-                embed = discord.Embed(
-                    title="🔐 Login to Stock Alerts",
-                    description=f"**Usage:** `{self.bot_prefix}login <username> <password>`\n\n"
-                               "This connects your Discord account to your AWS stock alerts system.\n"
-                               "⚠️ Your login message will be deleted for security.",
-                    color=0x3498db
-                )
-                await ctx.send(embed=embed)
+                await send(embed=self._embed_login_usage.copy())
                 return
             
             # Delete the command message for security (contains password)
             try:
                 await ctx.message.delete()
-                print(f"🗑️ Deleted login message from {ctx.author}")
+                logger.debug("Deleted login message from %s", ctx.author)
             except discord.errors.NotFound:
-                print("❌ Message already deleted or doesn't exist.")
+                logger.debug("Message already deleted or doesn't exist.")
             except discord.errors.Forbidden:
-                print("🚫 Bot lacks permission to delete this message.")
-                await ctx.send("⚠️ Cannot delete your message in private chat!. Please delete it manually for security.")
+                logger.debug("Bot lacks permission to delete this message.")
+                await send("⚠️ Cannot delete your message in private chat!. Please delete it manually for security.")
             except Exception as e:
-                print(f"⚠️ Unexpected error deleting message: {e}")
-                await ctx.send("⚠️ An unexpected error occurred. Please try again later.")
+                logger.exception("Unexpected error deleting message")
+                await send("⚠️ An unexpected error occurred. Please try again later.")
             # Show loading message
-            loading_msg = await ctx.send("🔄 Connecting to your stock alerts system...")
+            loading_msg = await send("🔄 Connecting to your stock alerts system...")
+            edit = loading_msg.edit
             
             try:
                 # Make API call to your Django login endpoint
-                login_url = f"{self.django_api_url}/api/auth/login/"
-                print(f"🌐 Attempting login to: {login_url}")
-                
-                response = requests.post(
-                    login_url,
-                    json={"username": username, "password": password},
-                    headers={"Content-Type": "application/json"},
-                    timeout=15  # 15 second timeout
-                )
-                
-                print(f"📡 Login response status: {response.status_code}")
-                
-                if response.status_code == 200:
+                logger.debug("Attempting login to: %s/api/auth/login/", self.django_api_url)
+
+                async with self.session.post(
+                    API_LOGIN,
+                    json={"username": username, "password": password}
+                ) as response:
+                    status = response.status
+                    try:
+                        data = _json_loads(await response.read())
+                    except Exception:
+                        data = {}
+
+                logger.debug("Login response status: %s", status)
+
+                if status == 200:
                     # Successful login
-                    data = response.json()
                     access_token = data.get('access')
-                    
-                    if access_token:
-                        # Store user session
-                        user_id = ctx.author.id
-                        self.user_sessions[user_id] = {
-                            'access_token': access_token,
-                            'username': username,
-                            'connected_at': datetime.now(),
-                            'refresh_token': data.get('refresh'),
-                            'last_alert_check': datetime.now()
-                        }
-                        
-                        # Set current channel as alert notification channel
-                        self.alert_channels[user_id] = ctx.channel.id
-                        
-                        print(f"✅ User {ctx.author} logged in successfully as {username}")
-                        
-                        # Try to get user's alert summary
-                        alert_summary = ""
-                    try:
-                            summary_response = requests.get(
-                                f"{self.django_api_url}/api/alerts/summary/",
-                                headers={'Authorization': f"Bearer {access_token}"},
-                                timeout=10
-                            )
-                            if summary_response.status_code == 200:
-                                 data = summary_response.json()
-                                 summary_data = data.get('summary', {})
-                                 alert_summary = (
-                                     f"\n📊 **Your Alert Summary:**\n"
-                                     f"• Active alerts: {summary_data.get('active_alerts', 0)}\n"
-                                 )
-                                 try:
-                                     triggered_response = requests.get(
-                                         f"{self.django_api_url}/api/alerts/triggered/",
-                                         headers={'Authorization': f"Bearer {access_token}"},
-                                         timeout=10
-                                     )
-                                     if triggered_response.status_code == 200:
-                                         triggered_data = triggered_response.json()
-                                         alert_summary += f"• Triggered alerts: {triggered_data.get('count', 0)}"
-                                 except Exception as e:
-                                     print(f"⚠️ Could not fetch triggered alerts: {e}")
-                    except Exception as e:
-                            print(f"⚠️ Could not fetch alert summary: {e}")
-                    
+
+                    if not access_token:
+                        raise Exception("No access token received from API")
+
+                    # Store user session (auth_headers is built once here and
+                    # reused by every API call for this user); the current
+                    # channel becomes the alert notification channel
+                    user_id = ctx.author.id
+                    self.user_sessions[user_id] = UserSession(
+                        access_token=access_token,
+                        refresh_token=data.get('refresh'),
+                        username=username,
+                        connected_at=datetime.now(),
+                        # 0.0 leaves the anti-spam window already elapsed, so
+                        # the first triggered alert after login notifies
+                        # immediately instead of waiting out 5 minutes
+                        last_alert_check=0.0,
+                        auth_headers={'Authorization': f"Bearer {access_token}"},
+                        alert_channel_id=ctx.channel.id
+                    )
+
+                    logger.info("User %s logged in successfully as %s", ctx.author, username)
+
+                    # Fetch the alert summary concurrently with building the
+                    # welcome embed below, so the round-trip is hidden behind
+                    # the Python-side work
+                    summary_task = asyncio.create_task(
+                        self._fetch_alert_summary(user_id, self.user_sessions[user_id].auth_headers)
+                    )
+
                     # Create success embed
-                    embed = discord.Embed(
+                    embed = Embed(
                         title="✅ Successfully Connected!",
                         description=f"Welcome **{username}**! Your Discord account is now connected to your stock alerts system.",
                         color=0x00ff00
                     )
-                    
+
                     # Safely display channel info
                     if hasattr(ctx.channel, "mention"):
                         channel_display = ctx.channel.mention
                     else:
                         channel_display = "Direct Messages"
-                    
+
                     embed.add_field(
                         name="🔔 Alert Notifications",
                         value=f"Will be sent to {channel_display}",
@@ -287,81 +835,53 @@ class StockAlertsBot:
                     )
                     embed.add_field(
                         name="🚀 Next Steps",
-                        value=f"• Use `{self.bot_prefix}alerts` to view your alerts\n"
-                              f"• Use `{self.bot_prefix}stocks` to see current prices\n"
-                              f"• Use `{self.bot_prefix}help` for all commands",
+                        value=f"• Use `{prefix}alerts` to view your alerts\n"
+                              f"• Use `{prefix}stocks` to see current prices\n"
+                              f"• Use `{prefix}help` for all commands",
                         inline=False
                     )
+                    alert_summary = await summary_task
                     if alert_summary:
                         embed.add_field(
                             name="📈 Current Status",
                             value=alert_summary,
                             inline=False
                         )
-                    
-                        
-                        # Update loading message with success
-                        await loading_msg.edit(content="", embed=embed)
-                        
-                    else:
-                        raise Exception("No access token received from API")
-                
+
+                    # Update loading message with success
+                    await edit(content="", embed=embed)
+
                 else:
                     # Login failed
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('detail', f'Login failed (HTTP {response.status_code})')
-                    except:
-                        error_msg = f'Login failed (HTTP {response.status_code})'
-                    
-                    print(f"❌ Login failed: {error_msg}")
+                    error_msg = data.get('detail', f'Login failed (HTTP {status})') if isinstance(data, dict) else f'Login failed (HTTP {status})'
+
+                    logger.warning("Login failed: %s", error_msg)
                     
-                    embed = discord.Embed(
-                        title="❌ Login Failed",
-                        description=f"**Error:** {error_msg}\n\n"
+                    embed = self._err(
+                        "❌ Login Failed",
+                        f"**Error:** {error_msg}\n\n"
                                    "Please check:\n"
                                    "• Username and password are correct\n"
                                    "• Your AWS Django system is running\n"
-                                   f"• API endpoint is accessible: `{self.django_api_url}`",
-                        color=0xff0000
+                                   f"• API endpoint is accessible: `{self.django_api_url}`"
                     )
-                    await loading_msg.edit(content="", embed=embed)
+                    await edit(content="", embed=embed)
             
-            except requests.exceptions.Timeout:
-                print("⏰ Request timeout")
-                embed = discord.Embed(
-                    title="⏰ Connection Timeout",
-                    description="The connection to your stock alerts API timed out.\n\n"
-                               "This might mean:\n"
-                               "• Your AWS server is slow to respond\n"
-                               "• Network connectivity issues\n"
-                               "• Your Django app is not running",
-                    color=0xff9500
-                )
-                await loading_msg.edit(content="", embed=embed)
+            except asyncio.TimeoutError:
+                logger.warning("Login request timeout")
+                await edit(content="", embed=self._embed_timeout.copy())
             
-            except requests.exceptions.ConnectionError:
-                print(f"🌐 Connection error to {self.django_api_url}")
-                embed = discord.Embed(
-                    title="🌐 Connection Error", 
-                    description=f"Cannot connect to your stock alerts API.\n\n"
-                               f"**API URL:** `{self.django_api_url}`\n\n"
-                               "Please check:\n"
-                               "• Your AWS Django system is running\n"
-                               "• The API URL in .env is correct\n"
-                               "• Your server allows external connections",
-                    color=0xff0000
-                )
-                await loading_msg.edit(content="", embed=embed)
+            except aiohttp.ClientConnectionError:
+                logger.warning("Connection error to %s", self.django_api_url)
+                await edit(content="", embed=self._embed_connection_error.copy())
             
             except Exception as e:
-                print(f"❌ Unexpected error during login: {e}")
-                embed = discord.Embed(
-                    title="❌ Unexpected Error",
-                    description=f"An unexpected error occurred: {str(e)}",
-                    color=0xff0000
+                logger.exception("Unexpected error during login")
+                embed = self._err(
+                    "❌ Unexpected Error",
+                    f"An unexpected error occurred: {str(e)}"
                 )
-                await loading_msg.edit(content="", embed=embed)
+                await edit(content="", embed=embed)
         
         @self.bot.command(name='alerts')
         async def alerts_command(ctx, filter_type: str = "all"):
@@ -369,119 +889,88 @@ class StockAlertsBot:
             Show your stock alerts
             Usage: !alerts [all|active|triggered]
             """
+
+            # Hoist hot lookups to locals for the embed-heavy body below
+            Embed = discord.Embed
+            prefix = self.bot_prefix
+            send = ctx.send
+
             
             # Check if user is logged in
             user_id = ctx.author.id
             if user_id not in self.user_sessions:
-                embed = discord.Embed(
-                    title="🔒 Not Connected",
-                    description=f"Please login first: `{self.bot_prefix}login <username> <password>`",
-                    color=0xff0000
-                )
-                await ctx.send(embed=embed)
+                await send(embed=self._embed_not_connected.copy())
                 return
             
             session = self.user_sessions[user_id]
-            loading_msg = await ctx.send("🔄 Fetching your alerts...")
+            loading_msg = await send("🔄 Fetching your alerts...")
+            edit = loading_msg.edit
             
             try:
                 # Determine API endpoint based on filter
-                if filter_type.lower() == "triggered":
-                    endpoint = "/api/alerts/triggered/"
-                    title = "🚨 Your Triggered Alerts"
-                    empty_message = "No triggered alerts found"
-                    color = 0xff0000
-                elif filter_type.lower() == "active":
-                    endpoint = "/api/alerts/"
-                    title = "🟢 Your Active Alerts"
-                    empty_message = "No active alerts found"
-                    color = 0x00ff00
-                else:
-                    endpoint = "/api/alerts/"
-                    title = "📈 All Your Stock Alerts"
-                    empty_message = "No alerts found"
-                    color = 0x3498db
-                
-                # Make API request
-                response = requests.get(
-                    f"{self.django_api_url}{endpoint}",
-                    headers={'Authorization': f"Bearer {session['access_token']}"},
-                    timeout=15
+                filter_type = filter_type.lower()
+                endpoint, title, empty_message, color = _ALERT_FILTERS.get(
+                    filter_type, _ALERT_FILTERS["all"]
                 )
                 
-                print(f"📡 Alerts response status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    data = response.json()
+                # Serve a fresh-enough cached response before going to the API
+                data = self._cache_get(user_id, endpoint)
+                if data is not None:
+                    status = 200
+                else:
+                    # Make API request
+                    async with self.session.get(
+                        endpoint,
+                        headers=session.auth_headers
+                    ) as response:
+                        status = response.status
+                        data = _json_loads(await response.read()) if status == 200 else None
+
+                    if status == 200:
+                        self._cache_put(user_id, endpoint, data)
+
+                logger.debug("Alerts response status: %s", status)
+
+                if status == 200:
                     # Handle both paginated and non-paginated responses
                     alerts = data.get('results', data) if isinstance(data, dict) else data
                     
                     if not alerts or len(alerts) == 0:
-                        embed = discord.Embed(
+                        embed = Embed(
                             title=title,
                             description=empty_message,
                             color=0xffff00
                         )
                         embed.add_field(
                             name="💡 Tip",
-                            value=f"Use `{self.bot_prefix}stocks` to see current stock prices",
+                            value=f"Use `{prefix}stocks` to see current stock prices",
                             inline=False
                         )
-                        await loading_msg.edit(content="", embed=embed)
+                        await edit(content="", embed=embed)
                         return
                     
                     # Filter active alerts if needed
-                    if filter_type.lower() == "active":
+                    if filter_type == "active":
                         alerts = [alert for alert in alerts if alert.get('is_active', True)]
                     
                     # Create rich embed with alerts
-                    embed = discord.Embed(
+                    embed = Embed(
                         title=title,
-                        description=f"Found **{len(alerts)}** alerts for **{session['username']}**",
+                        description=f"Found **{len(alerts)}** alerts for **{session.username}**",
                         color=color,
                         timestamp=datetime.now()
                     )
                     
-                    # Add up to 10 alerts (Discord embed field limit)
-                    alerts_shown = 0
-                    for alert in alerts[:10]:
-                        # Get alert details
-                        stock_symbol = alert.get('stock_symbol', alert.get('stock', 'Unknown'))
-                        is_active = alert.get('is_active', True)
-                        status_emoji = "🟢" if is_active else "🔴"
-                        
-                        # Create field name and value
-                        field_name = f"{status_emoji} {stock_symbol}"
-                        
-                        field_lines = []
-                        field_lines.append(f"**Type:** {alert.get('alert_type', 'N/A')}")
-                        field_lines.append(f"**Condition:** {alert.get('condition', 'N/A')} ${alert.get('threshold_price', 'N/A')}")
-                        
-                        if alert.get('duration_minutes'):
-                            field_lines.append(f"**Duration:** {alert['duration_minutes']} minutes")
-                        
-                        # Add dates
-                        if alert.get('created_at'):
-                            try:
-                                created = datetime.fromisoformat(alert['created_at'].replace('Z', '+00:00'))
-                                field_lines.append(f"**Created:** {created.strftime('%m/%d/%Y')}")
-                            except:
-                                pass
-                        
-                        if alert.get('triggered_at'):
-                            try:
-                                triggered = datetime.fromisoformat(alert['triggered_at'].replace('Z', '+00:00'))
-                                field_lines.append(f"**Triggered:** {triggered.strftime('%m/%d %H:%M')}")
-                            except:
-                                pass
-                        
-                        # Add field to embed
-                        embed.add_field(
+                    # Add up to 10 alerts (Discord embed field limit); bind the
+                    # bound method once for the loop
+                    add_field = embed.add_field
+                    top_alerts = alerts[:10]
+                    for field_name, field_value in map(_format_alert, top_alerts):
+                        add_field(
                             name=field_name,
-                            value="\n".join(field_lines),
+                            value=field_value,
                             inline=True  # Display in columns
                         )
-                        alerts_shown += 1
                     
                     # Add footer if there are more alerts
                     if len(alerts) > 10:
@@ -489,40 +978,31 @@ class StockAlertsBot:
                     else:
                         embed.set_footer(text=f"Total: {len(alerts)} alerts")
                     
-                    await loading_msg.edit(content="", embed=embed)
+                    await edit(content="", embed=embed)
                 
-                elif response.status_code == 401:
+                elif status == 401:
                     # Token expired - remove session
-                    print(f"🔑 Token expired for user {ctx.author}")
-                    del self.user_sessions[user_id]
-                    if user_id in self.alert_channels:
-                        del self.alert_channels[user_id]
+                    logger.info("Token expired for user %s", ctx.author)
+                    self._cache_invalidate(user_id)
+                    self.user_sessions.pop(user_id, None)
                     
-                    embed = discord.Embed(
-                        title="🔒 Session Expired",
-                        description="Your login session has expired.\n\n"
-                                   f"Please login again: `{self.bot_prefix}login <username> <password>`",
-                        color=0xff0000
-                    )
-                    await loading_msg.edit(content="", embed=embed)
+                    await edit(content="", embed=self._embed_session_expired.copy())
                 
                 else:
                     # Other API error
-                    embed = discord.Embed(
-                        title="❌ API Error",
-                        description=f"Failed to fetch alerts (HTTP {response.status_code})",
-                        color=0xff0000
+                    embed = self._err(
+                        "❌ API Error",
+                        f"Failed to fetch alerts (HTTP {status})"
                     )
-                    await loading_msg.edit(content="", embed=embed)
+                    await edit(content="", embed=embed)
             
             except Exception as e:
-                print(f"❌ Error fetching alerts: {e}")
-                embed = discord.Embed(
-                    title="❌ Connection Error",
-                    description="Could not connect to the stock alerts API",
-                    color=0xff0000
+                logger.exception("Error fetching alerts")
+                embed = self._err(
+                    "❌ Connection Error",
+                    "Could not connect to the stock alerts API"
                 )
-                await loading_msg.edit(content="", embed=embed)
+                await edit(content="", embed=embed)
                 
         @self.bot.command(name='alert', aliases=['createalert', 'setalert'])
         async def create_alert_command(ctx, stock_id: int, condition: str, price: str, duration: int = None, alert_type: str = "THRESHOLD"):
@@ -539,15 +1019,17 @@ class StockAlertsBot:
                 Duration: minutes (optional, defaults to very long time)
                 """
 
+                # Hoist hot lookups to locals for the embed-heavy body below
+                Embed = discord.Embed
+                send = ctx.send
+
                 # Validate condition
-                valid_conditions = ['>', '<', '>=', '<=', '==']
-                if condition not in valid_conditions:
-                    embed = discord.Embed(
-                        title="❌ Invalid Condition",
-                        description=f"Condition must be one of: {', '.join(valid_conditions)}",
-                        color=0xff0000
+                if condition not in _VALID_CONDITIONS:
+                    embed = self._err(
+                        "❌ Invalid Condition",
+                        "Condition must be one of: >, <, >=, <=, =="
                     )
-                    await ctx.send(embed=embed)
+                    await send(embed=embed)
                     return
 
                 
@@ -555,35 +1037,27 @@ class StockAlertsBot:
                 # if duration not none
                 if duration is not None:
                     if duration <= 0:
-                        embed = discord.Embed(
-                            title="❌ Invalid Duration",
-                            description="Duration must be a positive number of minutes",
-                            color=0xff0000
+                        embed = self._err(
+                            "❌ Invalid Duration",
+                            "Duration must be a positive number of minutes"
                         )
-                        await ctx.send(embed=embed)
+                        await send(embed=embed)
                         return
                     
                 try:
                   price = float(price)
                 except ValueError:
-                    embed = discord.Embed(
-                       title="❌ Invalid Price",
-                       description="Price must be a valid number (example: `150.50`).",
-                       color=0xff0000
+                    embed = self._err(
+                       "❌ Invalid Price",
+                       "Price must be a valid number (example: `150.50`)."
                     )
-                    await ctx.send(embed=embed)
+                    await send(embed=embed)
                     return    
 
 
-                loading_msg = await ctx.send("🔔 Creating stock alert...")
                 user_id = ctx.author.id
                 if user_id not in self.user_sessions:
-                     embed = discord.Embed(
-                         title="🔒 Not Connected",
-                         description=f"Please login first: `{self.bot_prefix}login <username> <password>`",
-                         color=0xff0000
-                     )
-                     await ctx.send(embed=embed)
+                     await send(embed=self._embed_not_connected.copy())
                      return
 
                 session = self.user_sessions[user_id]
@@ -601,23 +1075,29 @@ class StockAlertsBot:
                     if duration is not None:
                         alert_data["duration_minutes"] = duration
 
-                    # Send POST request to create alert
-                    response = requests.post(
-                        f"{self.django_api_url}/api/alerts/",
+                    # Send POST request to create alert; the typing
+                    # indicator stands in for the old loading message
+                    # without costing a second REST call
+                    async with ctx.typing(), self.session.post(
+                        API_ALERTS,
                         json=alert_data,
-                        headers={'Content-Type': 'application/json',
-                                 'Authorization': f"Bearer {session['access_token']}"},
-                        timeout=15
-                    )
+                        headers=session.auth_headers
+                    ) as response:
+                        status = response.status
+                        try:
+                            response_data = _json_loads(await response.read())
+                        except Exception:
+                            response_data = None
 
-                    print(f"🔔 Alert creation response status: {response.status_code}")
-                    print(f"🔔 Alert data sent: {alert_data}")
+                    logger.debug("Alert creation response status: %s", status)
+                    logger.debug("Alert data sent: %s", alert_data)
 
-                    if response.status_code in [200, 201]:
-                        # Alert created successfully
-                        response_data = response.json()
+                    if status in [200, 201]:
+                        # Alert created successfully - cached alert lists are
+                        # now stale, so drop them
+                        self._cache_invalidate(user_id)
 
-                        embed = discord.Embed(
+                        embed = Embed(
                             title="✅ Alert Created Successfully",
                             color=0x00ff00
                         )
@@ -655,12 +1135,12 @@ class StockAlertsBot:
                         )
 
                         embed.set_footer(text="Alert will notify when condition is met")
-                        await loading_msg.edit(content="", embed=embed)
+                        await send(embed=embed)
 
-                    elif response.status_code == 400:
+                    elif status == 400:
                         # Bad request - validation error
                         try:
-                            error_data = response.json()
+                            error_data = response_data
                             error_msg = "Invalid data provided"
                             if isinstance(error_data, dict):
                                 # Try to extract meaningful error messages
@@ -675,64 +1155,57 @@ class StockAlertsBot:
                         except:
                             error_msg = "Invalid data format"
 
-                        embed = discord.Embed(
-                            title="❌ Validation Error",
-                            description=f"```{error_msg}```",
-                            color=0xff0000
+                        embed = self._err(
+                            "❌ Validation Error",
+                            f"```{error_msg}```"
                         )
-                        await loading_msg.edit(content="", embed=embed)
+                        await send(embed=embed)
 
-                    elif response.status_code == 404:
-                        embed = discord.Embed(
-                            title="❌ Stock Not Found",
-                            description=f"Stock with ID {stock_id} does not exist",
-                            color=0xff0000
+                    elif status == 404:
+                        embed = self._err(
+                            "❌ Stock Not Found",
+                            f"Stock with ID {stock_id} does not exist"
                         )
-                        await loading_msg.edit(content="", embed=embed)
+                        await send(embed=embed)
 
                     else:
-                        embed = discord.Embed(
-                            title="❌ Server Error",
-                            description=f"Failed to create alert (HTTP {response.status_code})",
-                            color=0xff0000
+                        embed = self._err(
+                            "❌ Server Error",
+                            f"Failed to create alert (HTTP {status})"
                         )
-                        await loading_msg.edit(content="", embed=embed)
+                        await send(embed=embed)
 
-                except requests.exceptions.Timeout:
-                    print("❌ Request timeout while creating alert")
-                    embed = discord.Embed(
-                        title="❌ Timeout Error",
-                        description="Request timed out while creating alert",
-                        color=0xff0000
+                except asyncio.TimeoutError:
+                    logger.warning("Request timeout while creating alert")
+                    embed = self._err(
+                        "❌ Timeout Error",
+                        "Request timed out while creating alert"
                     )
-                    await loading_msg.edit(content="", embed=embed)
+                    await send(embed=embed)
 
-                except requests.exceptions.RequestException as e:
-                    print(f"❌ Request error while creating alert: {e}")
-                    embed = discord.Embed(
-                        title="❌ Connection Error",
-                        description="Could not connect to the alert API",
-                        color=0xff0000
+                except aiohttp.ClientError as e:
+                    logger.warning("Request error while creating alert: %s", e)
+                    embed = self._err(
+                        "❌ Connection Error",
+                        "Could not connect to the alert API"
                     )
-                    await loading_msg.edit(content="", embed=embed)
+                    await send(embed=embed)
 
                 except ValueError as e:
-                    print(f"❌ Value error: {e}")
-                    embed = discord.Embed(
-                        title="❌ Input Error",
-                        description="Invalid input values provided",
-                        color=0xff0000
+                    logger.warning("Value error while creating alert: %s", e)
+                    embed = self._err(
+                        "❌ Input Error",
+                        "Invalid input values provided"
                     )
-                    await loading_msg.edit(content="", embed=embed)
+                    await send(embed=embed)
 
                 except Exception as e:
-                    print(f"❌ Unexpected error while creating alert: {e}")
-                    embed = discord.Embed(
-                        title="❌ Unexpected Error",
-                        description="An unexpected error occurred while creating the alert",
-                        color=0xff0000
+                    logger.exception("Unexpected error while creating alert")
+                    embed = self._err(
+                        "❌ Unexpected Error",
+                        "An unexpected error occurred while creating the alert"
                     )
-                    await loading_msg.edit(content="", embed=embed)
+                    await send(embed=embed)
 
 
         @self.bot.command(name='alerthelp', aliases=['alertinfo'])
@@ -740,46 +1213,7 @@ class StockAlertsBot:
                 """
                 Show help information for the alert command
                 """
-                embed = discord.Embed(
-                    title="🔔 Stock Alert Help",
-                    description="Learn how to create stock price alerts",
-                    color=0x0099ff
-                )
-
-                embed.add_field(
-                    name="📝 Basic Usage",
-                    value="`!alert <stock_id> <condition> <price> [duration]`",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="🔢 Parameters",
-                    value="""
-                    **stock_id**: ID of the stock to monitor
-                    **condition**: >, <, >=, <=, ==
-                    **price**: Target price (decimal)
-                    **duration**: Minutes (optional)
-                    """,
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="💡 Examples",
-                    value="""
-                    `!alert 1 > 150.50` - Alert when stock 1 goes above $150.50
-                    `!alert 2 < 50.00 60` - Alert when stock 2 goes below $50 (1 hour)
-                    `!alert 3 >= 100.25 1440` - Alert when stock 3 reaches $100.25+ (24 hours)
-                    """,
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="⏰ Duration",
-                    value="If not specified, alert will remain active indefinitely",
-                    inline=False
-                )
-
-                await ctx.send(embed=embed)        
+                await ctx.send(embed=self._embed_alert_help)        
                 
          
          
@@ -791,32 +1225,31 @@ class StockAlertsBot:
             Usage: !stocks
             """
 
-            loading_msg = await ctx.send("📊 Fetching current stock prices...")
-
             try:
-                response = requests.get(
-                    f"{self.django_api_url}/api/stocks/",
-                    timeout=15
-                )
+                # Typing indicator instead of a loading message - one REST
+                # call per invocation instead of a send plus an edit
+                async with ctx.typing():
+                    status, stocks_data = await self._get_stocks()
 
-                print(f"📡 Stocks response status: {response.status_code}")
+                logger.debug("Stocks response status: %s", status)
 
-                if response.status_code == 200:
-                    stocks_data = response.json()
+                if status == 200:
 
                     # If API returns a dict with a key holding the list
                     if isinstance(stocks_data, dict):
-                        if "results" in stocks_data and isinstance(stocks_data["results"], list):
-                            stocks = stocks_data["results"]
-                        elif "stocks" in stocks_data:
-                            stocks = stocks_data["stocks"]
-                        elif "data" in stocks_data:
-                            stocks = stocks_data["data"]
-                        else:
-                            # Convert dict values to list, but filter for dict items only
+                        stocks = (
+                            stocks_data.get("results")
+                            or stocks_data.get("stocks")
+                            or stocks_data.get("data")
+                            or []
+                        )
+                        if not stocks and stocks_data:
+                            # Last resort for unrecognized payload shapes:
+                            # scan the dict values for stock-looking entries
+                            logger.warning(
+                                "Unrecognized stocks payload shape; falling back to value scan"
+                            )
                             stocks = [v for v in stocks_data.values() if isinstance(v, dict)]
-                            if not stocks:
-                                stocks = []
                     else:
                         stocks = stocks_data if isinstance(stocks_data, list) else []
 
@@ -826,14 +1259,13 @@ class StockAlertsBot:
                             description="No stock data available",
                             color=0xffff00
                         )
-                        await loading_msg.edit(content="", embed=embed)
+                        await ctx.send(embed=embed)
                         return
 
-                    # Create embed BEFORE the loop
-                    embed = discord.Embed(
-                        title="📊 Current Stock Prices",
-                        color=0x00ff00
-                    )
+                    # Collect plain field dicts and build the embed in a
+                    # single from_dict pass below, instead of paying
+                    # add_field's per-call work 15 times
+                    fields = []
 
                     # Slice safely and add fields
                     display_stocks = stocks[:15]  # Limit to first 15 stocks
@@ -856,72 +1288,72 @@ class StockAlertsBot:
                         else:
                             price_display = "N/A"
 
-                        # Get last updated time
+                        # Get last updated time. API timestamps are ISO-8601
+                        # ("YYYY-MM-DDTHH:MM:SS..."), so the HH:MM we display
+                        # sits at a fixed offset - slice it out instead of
+                        # running the full parse/strftime path per stock
                         last_updated = stock.get('last_updated', 'N/A')
-                        if last_updated != 'N/A' and last_updated is not None:
-                            try:
-                                # Handle different datetime formats
-                                if isinstance(last_updated, str):
-                                    # Remove timezone info if present and parse
-                                    clean_time = last_updated.replace('Z', '+00:00')
-                                    updated_time = datetime.fromisoformat(clean_time)
-                                    time_display = updated_time.strftime('%H:%M')
-                                else:
-                                    time_display = "Unknown"
-                            except (ValueError, AttributeError):
-                                time_display = "Unknown"
-                        else:
-                            time_display = "Unknown"
-
-                        # Add field to embed
-                        embed.add_field(
-                            name=f"📈 {symbol}",
-                            value=f"**{price_display}**\n*Updated: {time_display}*",
-                            inline=True
-                        )
+                        time_display = "Unknown"
+                        if isinstance(last_updated, str) and last_updated != 'N/A':
+                            hhmm = last_updated[11:16]
+                            if len(hhmm) == 5 and hhmm[2] == ':' and hhmm[:2].isdigit() and hhmm[3:].isdigit():
+                                time_display = hhmm
+                            else:
+                                try:
+                                    time_display = _parse_iso(last_updated).strftime('%H:%M')
+                                except (ValueError, AttributeError):
+                                    pass
+
+                        fields.append({
+                            "name": f"📈 {symbol}",
+                            "value": f"**{price_display}**\n*Updated: {time_display}*",
+                            "inline": True
+                        })
 
-                    # Add footer
                     if len(stocks) > 15:
-                        embed.set_footer(text=f"Showing first 15 of {len(stocks)} stocks")
+                        footer_text = f"Showing first 15 of {len(stocks)} stocks"
                     else:
-                        embed.set_footer(text=f"Showing {len(stocks)} stocks • Data from API")
+                        footer_text = f"Showing {len(stocks)} stocks • Data from API"
 
-                    await loading_msg.edit(content="", embed=embed)
+                    embed = discord.Embed.from_dict({
+                        "title": "📊 Current Stock Prices",
+                        "color": 0x00ff00,
+                        "fields": fields,
+                        "footer": {"text": footer_text}
+                    })
+
+                    await ctx.send(embed=embed)
 
                 else:
-                    embed = discord.Embed(
-                        title="❌ Error",
-                        description=f"Failed to fetch stock data (HTTP {response.status_code})",
-                        color=0xff0000
+                    embed = self._err(
+                        "❌ Error",
+                        f"Failed to fetch stock data (HTTP {status})"
                     )
-                    await loading_msg.edit(content="", embed=embed)
+                    await ctx.send(embed=embed)
 
-            except requests.exceptions.Timeout:
-                print("❌ Request timeout")
-                embed = discord.Embed(
-                    title="❌ Timeout Error",
-                    description="Request timed out while fetching stock data",
-                    color=0xff0000
+            except asyncio.TimeoutError:
+                logger.warning("Timed out fetching stock data")
+                embed = self._err(
+                    "❌ Timeout Error",
+                    "Request timed out while fetching stock data"
                 )
-                await loading_msg.edit(content="", embed=embed)
+                await ctx.send(embed=embed)
 
-            except requests.exceptions.RequestException as e:
-                print(f"❌ Request error: {e}")
-                embed = discord.Embed(
-                    title="❌ Connection Error",
-                    description="Could not connect to the stock data API",
-                    color=0xff0000
+            except aiohttp.ClientError:
+                logger.exception("Request error fetching stock data")
+                embed = self._err(
+                    "❌ Connection Error",
+                    "Could not connect to the stock data API"
                 )
-                await loading_msg.edit(content="", embed=embed)
+                await ctx.send(embed=embed)
 
-            except Exception as e:
-                print(f"❌ Unexpected error: {e}")
-                embed = discord.Embed(
-                    title="❌ Unexpected Error",
-                    description="An unexpected error occurred while processing stock data",
-                    color=0xff0000
+            except Exception:
+                logger.exception("Unexpected error processing stock data")
+                embed = self._err(
+                    "❌ Unexpected Error",
+                    "An unexpected error occurred while processing stock data"
                 )
-                await loading_msg.edit(content="", embed=embed)
+                await ctx.send(embed=embed)
         
         
         @self.bot.command(name='status')
@@ -941,41 +1373,51 @@ class StockAlertsBot:
             # Connection status
             if user_id in self.user_sessions:
                 session = self.user_sessions[user_id]
-                connected_time = session['connected_at'].strftime('%Y-%m-%d %H:%M UTC')
-                
+                connected_time = session.connected_at.strftime('%Y-%m-%d %H:%M UTC')
+
                 embed.add_field(
                     name="🟢 Connection Status",
-                    value=f"**Connected as:** {session['username']}\n"
+                    value=f"**Connected as:** {session.username}\n"
                           f"**Since:** {connected_time}",
                     inline=False
                 )
                 
-                # Test API connection
-                try:
-                    test_response = requests.get(
-                        f"{self.django_api_url}/api/alerts/summary/",
-                        headers={'Authorization': f"Bearer {session['access_token']}"},
-                        timeout=10
-                    )
-                    
-                    if test_response.status_code == 200:
-                        summary = test_response.json()
-                        embed.add_field(
-                            name="📊 Alert Summary",
-                            value=f"**Active:** {summary.get('active_count', 0)}\n"
-                                  f"**Triggered:** {summary.get('triggered_count', 0)}",
-                            inline=True
+                # Test API connection - the login-time summary fetch
+                # seeds this cache entry, so a fresh one skips the
+                # round-trip entirely
+                summary = self._cache_get(user_id, API_ALERTS_SUMMARY)
+                if summary is not None:
+                    test_status = 200
+                else:
+                    try:
+                        test_status, body = await self._request_with_backoff(
+                            "GET",
+                            API_ALERTS_SUMMARY,
+                            headers=session.auth_headers,
+                            timeout=aiohttp.ClientTimeout(total=10)
                         )
-                        api_status = "✅ Connected"
-                        api_color = 0x00ff00
-                    else:
-                        api_status = f"⚠️ HTTP {test_response.status_code}"
-                        api_color = 0xff9500
-                
-                except Exception as e:
+                        summary = _json_loads(body) if test_status == 200 else None
+                        if summary is not None:
+                            self._cache_put(user_id, API_ALERTS_SUMMARY, summary)
+                    except Exception:
+                        test_status = None
+
+                if test_status == 200:
+                    embed.add_field(
+                        name="📊 Alert Summary",
+                        value=f"**Active:** {summary.get('active_count', 0)}\n"
+                              f"**Triggered:** {summary.get('triggered_count', 0)}",
+                        inline=True
+                    )
+                    api_status = "✅ Connected"
+                    api_color = 0x00ff00
+                elif test_status is not None:
+                    api_status = f"⚠️ HTTP {test_status}"
+                    api_color = 0xff9500
+                else:
                     api_status = "❌ Connection Failed"
                     api_color = 0xff0000
-                
+
                 embed.add_field(
                     name="🌐 API Status",
                     value=api_status,
@@ -999,7 +1441,10 @@ class StockAlertsBot:
             )
             
             # Alert channel
-            alert_channel_id = self.alert_channels.get(user_id, ctx.channel.id)
+            if user_id in self.user_sessions:
+                alert_channel_id = self.user_sessions[user_id].alert_channel_id
+            else:
+                alert_channel_id = ctx.channel.id
             embed.add_field(
                 name="🔔 Alert Channel",
                 value=f"<#{alert_channel_id}>",
@@ -1024,16 +1469,15 @@ class StockAlertsBot:
             """
             
             user_id = ctx.author.id
-            
-            if user_id in self.user_sessions:
-                username = self.user_sessions[user_id]['username']
-                
-                # Remove session and alert channel
-                del self.user_sessions[user_id]
-                if user_id in self.alert_channels:
-                    del self.alert_channels[user_id]
-                
-                print(f"👋 User {ctx.author} logged out ({username})")
+
+            # Remove session in one lookup (the alert channel lives on it)
+            session = self.user_sessions.pop(user_id, None)
+            self._cache_invalidate(user_id)
+
+            if session is not None:
+                username = session.username
+
+                logger.info("User %s logged out (%s)", ctx.author, username)
                 
                 embed = discord.Embed(
                     title="👋 Disconnected",
@@ -1057,60 +1501,10 @@ class StockAlertsBot:
             Usage: !start
             """
             
-            embed = discord.Embed(
-                title="🤖 Stock Alerts Bot - Help",
-                description="Connect to your AWS-deployed Django stock alerts system\n"
-                           f"**Command Prefix:** `{self.bot_prefix}`",
-                color=0x3498db
-            )
-            
-            # Authentication commands
-            embed.add_field(
-                name="🔐 Authentication",
-                value=f"`{self.bot_prefix}register <user> <pass>` - Register a new account\n"
-                      f"`{self.bot_prefix}login <user> <pass>` - Connect to your account\n"
-                      f"`{self.bot_prefix}logout` - Disconnect from account\n"
-                      f"`{self.bot_prefix}status` - Check connection status",
-                inline=False
-            )
-            
-            # Alert commands
-            embed.add_field(
-                name="📈 Stock Alerts",
-                value=f"`{self.bot_prefix}alert <stock_id> <condition> <price> [duration]` - Create a stock alert\n"
-                      f"`{self.bot_prefix}alerthelp` - See how to use the create alert command\n"
-                      f"`{self.bot_prefix}alerts` - Show all your alerts\n"
-                      f"`{self.bot_prefix}alerts active` - Show only active alerts\n"
-                      f"`{self.bot_prefix}alerts triggered` - Show triggered alerts",
-                inline=False
-            )
-            
-            # Stock data commands
-            embed.add_field(
-                name="📊 Stock Data",
-                value=f"`{self.bot_prefix}stocks` - Show current stock prices\n"
-                      f"`{self.bot_prefix}refresh` - Manually refresh stock prices",
-                inline=False
-            )
-            
-            # Bot information
-            embed.add_field(
-                name="ℹ️ Information",
-                value=f"`{self.bot_prefix}start` - Show this help message\n"
-                      f"`{self.bot_prefix}ping` - Check bot response time",
-                inline=False
-            )
-            
-            # Add setup instructions
-            embed.add_field(
-                name="🚀 Getting Started",
-                value=f"1. Use `{self.bot_prefix}login <username> <password>`\n"
-                      f"2. Check your alerts with `{self.bot_prefix}alerts`\n"
-                      f"3. Monitor stock prices with `{self.bot_prefix}stocks`\n"
-                      f"4. The bot will notify you of triggered alerts automatically!",
-                inline=False
-            )
-            
+            # The bot avatar isn't known until login, so the footer is the
+            # only part stamped per-invocation, onto a copy of the prebuilt
+            # embed
+            embed = self._embed_start.copy()
             embed.set_footer(
                 text=f"API: {self.django_api_url}",
                 icon_url=self.bot.user.avatar.url if self.bot.user.avatar else None
@@ -1127,27 +1521,23 @@ class StockAlertsBot:
             
             user_id = ctx.author.id
             if user_id not in self.user_sessions:
-                embed = discord.Embed(
-                    title="🔒 Not Connected",
-                    description=f"Please login first: `{self.bot_prefix}login <username> <password>`",
-                    color=0xff0000
-                )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=self._embed_not_connected.copy())
                 return
             
             session = self.user_sessions[user_id]
-            loading_msg = await ctx.send("🔄 Refreshing stock prices...")
-            
             try:
-                # Call the refresh endpoint from your Django API
-                response = requests.post(
-                    f"{self.django_api_url}/api/stocks/refresh_prices/",
-                    headers={'Authorization': f"Bearer {session['access_token']}"},
-                    timeout=30  # Longer timeout for refresh operation
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
+                # Call the refresh endpoint from your Django API; the
+                # typing indicator covers the wait without a message edit
+                async with ctx.typing():
+                    status, body = await self._request_with_backoff(
+                        "POST",
+                        API_STOCKS_REFRESH,
+                        headers=session.auth_headers,
+                        timeout=aiohttp.ClientTimeout(total=30)  # Longer timeout for refresh operation
+                    )
+                data = _json_loads(body) if status == 200 else None
+
+                if status == 200:
                     embed = discord.Embed(
                         title="✅ Refresh Complete",
                         description="Stock prices have been refreshed successfully!",
@@ -1171,31 +1561,29 @@ class StockAlertsBot:
                     
                     embed.set_footer(text=f"Use {self.bot_prefix}stocks to see updated prices")
                     
-                elif response.status_code == 401:
+                elif status == 401:
                     # Token expired
-                    del self.user_sessions[user_id]
-                    embed = discord.Embed(
-                        title="🔒 Session Expired",
-                        description="Please login again",
-                        color=0xff0000
+                    self.user_sessions.pop(user_id, None)
+                    self._cache_invalidate(user_id)
+                    embed = self._err(
+                        "🔒 Session Expired",
+                        "Please login again"
                     )
                 else:
-                    embed = discord.Embed(
-                        title="❌ Refresh Failed",
-                        description=f"HTTP {response.status_code}: Could not refresh prices",
-                        color=0xff0000
+                    embed = self._err(
+                        "❌ Refresh Failed",
+                        f"HTTP {status}: Could not refresh prices"
                     )
                 
-                await loading_msg.edit(content="", embed=embed)
+                await ctx.send(embed=embed)
                 
-            except Exception as e:
-                print(f"❌ Error refreshing prices: {e}")
-                embed = discord.Embed(
-                    title="❌ Refresh Error",
-                    description="Could not refresh stock prices",
-                    color=0xff0000
+            except Exception:
+                logger.exception("Error refreshing prices")
+                embed = self._err(
+                    "❌ Refresh Error",
+                    "Could not refresh stock prices"
                 )
-                await loading_msg.edit(content="", embed=embed)
+                await ctx.send(embed=embed)
         
         @self.bot.command(name='ping')
         async def ping_command(ctx):
@@ -1204,29 +1592,34 @@ class StockAlertsBot:
             Usage: !ping
             """
             
-            start_time = datetime.now()
+            # perf_counter is the monotonic high-resolution clock meant for
+            # short intervals - datetime.now() only resolves to ~ms and can
+            # jump with the wall clock
+            t0 = time.perf_counter()
             
             # Send initial message
             message = await ctx.send("🏓 Pinging...")
             
             # Calculate Discord API latency
-            end_time = datetime.now()
-            discord_latency = (end_time - start_time).total_seconds() * 1000
+            discord_latency = (time.perf_counter() - t0) * 1000
             
             # Test Django API connectivity
             api_latency = "N/A"
             api_status = "❌ Failed"
             
             try:
-                api_start = datetime.now()
-                response = requests.get(f"{self.django_api_url}/api/stocks/", timeout=10)
-                api_end = datetime.now()
-                
-                if response.status_code == 200:
-                    api_latency = f"{(api_end - api_start).total_seconds() * 1000:.0f}ms"
+                api_start = time.perf_counter()
+                status, _body = await self._request_with_backoff(
+                    "GET",
+                    API_STOCKS,
+                    timeout=aiohttp.ClientTimeout(total=10)
+                )
+
+                if status == 200:
+                    api_latency = f"{(time.perf_counter() - api_start) * 1000:.0f}ms"
                     api_status = "✅ Connected"
                 else:
-                    api_status = f"⚠️ HTTP {response.status_code}"
+                    api_status = f"⚠️ HTTP {status}"
                     
             except Exception as e:
                 api_status = "❌ Connection Failed"
@@ -1248,7 +1641,7 @@ class StockAlertsBot:
                 inline=True
             )
             
-            embed.set_footer(text=f"Bot uptime: {str(datetime.now() - start_time).split('.')[0]}")
+            embed.set_footer(text=f"Bot uptime: {str(datetime.now(timezone.utc) - self.started_at).split('.')[0]}")
             
             await message.edit(content="", embed=embed)
     
@@ -1262,66 +1655,195 @@ class StockAlertsBot:
         # Skip if no users are logged in
         if not self.user_sessions:
             return
-        
-        print(f"🔍 Monitoring triggered alerts for {len(self.user_sessions)} users...")
-        
-        # Check each logged-in user
-        for user_id, session in list(self.user_sessions.items()):
-            try:
-                # Get triggered alerts for this user
-                response = requests.get(
-                    f"{self.django_api_url}/api/alerts/triggered/",
-                    headers={'Authorization': f"Bearer {session['access_token']}"},
-                    timeout=15
+
+        if self._monitor_lock.locked():
+            logger.warning("Previous monitor tick still running; skipping this one")
+            return
+
+        async with self._monitor_lock:
+            logger.debug("Monitoring triggered alerts for %s users...", len(self.user_sessions))
+
+            # One bulk round-trip replaces the per-user fan-out when the
+            # backend supports it (and a service token is configured)
+            if self._bulk_poll_supported and await self._poll_bulk():
+                return
+
+            # Poll every logged-in user concurrently over the shared HTTP
+            # session; wall-clock time stays at ~one round-trip instead of
+            # growing with the number of users
+            results = await asyncio.gather(
+                *(self._poll_user(user_id, session)
+                  for user_id, session in list(self.user_sessions.items())),
+                return_exceptions=True
+            )
+
+            # Sessions that came back 401 are removed here, after the gather,
+            # so expiry never mutates user_sessions while it is being iterated
+            for user_id in results:
+                if isinstance(user_id, int) and user_id in self.user_sessions:
+                    await self._expire_session(user_id)
+
+    @monitor_triggered_alerts.before_loop
+    async def _before_monitor(self):
+        """
+        Hold the monitor until the gateway connection is fully ready, so a
+        reconnect storm can't fire polls against a half-initialized bot
+        """
+        await self.bot.wait_until_ready()
+
+    async def _poll_user(self, user_id, session):
+        """
+        Check one user's triggered alerts and notify them if a notification is due
+
+        Returns the user_id if the session turned out to be expired, so the
+        caller can drop it once the whole poll round has finished.
+        """
+        try:
+            # Get triggered alerts for this user
+            async with self._poll_semaphore:
+                status, body = await self._request_with_backoff(
+                    "GET",
+                    API_ALERTS_TRIGGERED,
+                    headers=session.auth_headers
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    alerts = data.get('results', data) if isinstance(data, dict) else data
-                    
-                    # If there are triggered alerts, send notification
-                    if alerts and len(alerts) > 0:
-                        user = self.bot.get_user(user_id)
-                        channel_id = self.alert_channels.get(user_id)
-                        
-                        if user and channel_id:
-                            channel = self.bot.get_channel(channel_id)
-                            if channel:
-                                # Check if we should send notification (avoid spam)
-                                last_check = session.get('last_alert_check', datetime.now() - timedelta(hours=1))
-                                time_since_last = datetime.now() - last_check
-                                
-                                # Only send notification if it's been at least 5 minutes since last one
-                                if time_since_last.total_seconds() >= 300:  # 5 minutes
-                                    await self.send_triggered_alert_notification(
-                                        channel, user, alerts, session['username']
-                                    )
-                                    # Update last check time
-                                    session['last_alert_check'] = datetime.now()
-                
-                elif response.status_code == 401:
-                    # Token expired - remove session
-                    print(f"🔑 Token expired for user ID {user_id}")
-                    del self.user_sessions[user_id]
-                    if user_id in self.alert_channels:
-                        del self.alert_channels[user_id]
-                    
-                    # Optionally notify user their session expired
+            data = _json_loads(body) if status == 200 else None
+
+            if status == 200:
+                alerts = data.get('results', data) if isinstance(data, dict) else data
+                self._dispatch_alerts(user_id, session, alerts)
+
+            elif status == 401:
+                # Token expired - hand the user_id back so the session is
+                # removed after the gather instead of mid-iteration
+                return user_id
+
+        except Exception as e:
+            logger.error("Error monitoring alerts for user %s: %s", user_id, e)
+
+        return None
+
+    def _dispatch_alerts(self, user_id, session, alerts):
+        """
+        Queue a triggered-alert notification for one user, honoring the
+        5-minute anti-spam window
+        """
+        # If there are triggered alerts, send notification
+        if not alerts:
+            return
+
+        # Drop alerts this session has already been notified about, so a
+        # row the API keeps returning doesn't renotify every window
+        alerts = [a for a in alerts if a.get('id') not in session.last_notified_ids]
+        if not alerts:
+            return
+
+        user = self.bot.get_user(user_id)
+        channel_id = session.alert_channel_id
+
+        if user and channel_id:
+            channel = self.bot.get_channel(channel_id)
+            if channel:
+                # Check if we should send notification (avoid spam)
+                # Only send notification if it's been at least 5 minutes since last one
+                if time.monotonic() - session.last_alert_check >= 300:  # 5 minutes
                     try:
-                        user = self.bot.get_user(user_id)
-                        if user:
-                            embed = discord.Embed(
-                                title="🔒 Session Expired",
-                                description="Your login session has expired. Please login again to continue receiving alerts.",
-                                color=0xff9500
-                            )
-                            await user.send(embed=embed)
-                    except:
-                        pass  # User might have DMs disabled
-                
-            except Exception as e:
-                print(f"❌ Error monitoring alerts for user {user_id}: {e}")
-    
+                        self._notify_queue.put_nowait(
+                            (channel, user, alerts, session.username)
+                        )
+                        # Update last check time
+                        session.last_alert_check = time.monotonic()
+                        session.last_notified_ids.update(a.get('id') for a in alerts)
+                    except asyncio.QueueFull:
+                        logger.warning(
+                            "Notification queue full; dropping notification for user %s",
+                            user_id
+                        )
+
+    async def _poll_bulk(self):
+        """
+        Fetch every user's triggered alerts in a single round-trip
+
+        Returns True when the poll round was handled here; False means the
+        endpoint is unavailable and the caller should fall back to the
+        per-user fan-out (the fallback sticks - one 404 disables the probe).
+        """
+        try:
+            status, body = await self._request_with_backoff(
+                "GET",
+                API_ALERTS_TRIGGERED_BULK,
+                headers=self._service_auth_headers
+            )
+        except Exception as e:
+            logger.error("Bulk alert poll failed: %s", e)
+            return True
+
+        if status == 404:
+            logger.info(
+                "Bulk triggered-alerts endpoint not available; "
+                "falling back to per-user polling"
+            )
+            self._bulk_poll_supported = False
+            return False
+
+        if status != 200:
+            logger.warning("Bulk alert poll returned HTTP %s", status)
+            return True
+
+        data = _json_loads(body)
+        if not isinstance(data, dict):
+            return True
+
+        # Response maps user ids to their triggered alerts
+        for user_key, alerts in data.items():
+            try:
+                user_id = int(user_key)
+            except (TypeError, ValueError):
+                continue
+            session = self.user_sessions.get(user_id)
+            if session:
+                self._dispatch_alerts(user_id, session, alerts)
+        return True
+
+    async def _expire_session(self, user_id):
+        """
+        Drop an expired session, clear its cached responses and let the
+        user know they need to log in again
+        """
+        logger.info("Token expired for user ID %s", user_id)
+        self._cache_invalidate(user_id)
+        self.user_sessions.pop(user_id, None)
+
+        # Optionally notify user their session expired. With the member
+        # cache disabled the user may not be cached, so fall back to a
+        # REST fetch.
+        try:
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            if user:
+                embed = discord.Embed(
+                    title="🔒 Session Expired",
+                    description="Your login session has expired. Please login again to continue receiving alerts.",
+                    color=0xff9500
+                )
+                await user.send(embed=embed)
+        except:
+            pass  # User might have DMs disabled
+
+
+    async def _notify_worker(self):
+        """
+        Drain queued alert notifications one at a time with a small gap
+        between sends, keeping bursts inside Discord's rate-limit bucket
+        """
+        while True:
+            channel, user, alerts, username = await self._notify_queue.get()
+            try:
+                await self.send_triggered_alert_notification(channel, user, alerts, username)
+            except Exception:
+                logger.exception("Error sending queued notification")
+            finally:
+                self._notify_queue.task_done()
+            await asyncio.sleep(1)
+
     async def send_triggered_alert_notification(self, channel, user, alerts, username):
         """
         Send a notification message when alerts are triggered
@@ -1340,29 +1862,29 @@ class StockAlertsBot:
             alerts_to_show = alerts[:5]
             
             for alert in alerts_to_show:
-                stock_symbol = alert.get('stock_symbol', alert.get('stock', 'Unknown'))
+                stock_symbol = alert.get('stock_symbol') or alert.get('stock') or 'Unknown'
                 condition = alert.get('condition', 'N/A')
                 threshold_price = alert.get('threshold_price', 'N/A')
                 alert_type = alert.get('alert_type', 'N/A')
-                
-                field_value_lines = [f"**{condition} ${threshold_price}**"]
-                
-                if alert_type != 'N/A':
-                    field_value_lines.append(f"Type: {alert_type}")
-                
-                if alert.get('duration_minutes'):
-                    field_value_lines.append(f"Duration: {alert['duration_minutes']} min")
-                
-                if alert.get('triggered_at'):
-                    try:
-                        triggered_time = datetime.fromisoformat(alert['triggered_at'].replace('Z', '+00:00'))
-                        field_value_lines.append(f"Triggered: {triggered_time.strftime('%H:%M')}")
-                    except:
-                        pass
-                
+                duration_minutes = alert.get('duration_minutes')
+                triggered_at = alert.get('triggered_at')
+
+                # HH:MM sits at a fixed offset in the ISO timestamp - slice
+                # it instead of a parse/strftime round-trip per alert
+                triggered = ""
+                if isinstance(triggered_at, str):
+                    hhmm = triggered_at[11:16]
+                    if len(hhmm) == 5 and hhmm[2] == ':':
+                        triggered = f"\nTriggered: {hhmm}"
+
                 embed.add_field(
                     name=f"🔴 {stock_symbol}",
-                    value="\n".join(field_value_lines),
+                    value=(
+                        f"**{condition} ${threshold_price}**"
+                        + (f"\nType: {alert_type}" if alert_type != 'N/A' else "")
+                        + (f"\nDuration: {duration_minutes} min" if duration_minutes else "")
+                        + triggered
+                    ),
                     inline=True
                 )
             
@@ -1379,14 +1901,14 @@ class StockAlertsBot:
             # Send notification with user mention
             await channel.send(f"{user.mention} 📢", embed=embed)
             
-            print(f"✅ Sent alert notification to {user} in {channel}")
-            
+            logger.info("Sent alert notification to %s in %s", user, channel)
+
         except discord.Forbidden:
-            print(f"❌ Cannot send message to channel {channel.id} - no permissions")
+            logger.warning("Cannot send message to channel %s - no permissions", channel.id)
         except discord.HTTPException as e:
-            print(f"❌ Discord API error sending notification: {e}")
-        except Exception as e:
-            print(f"❌ Unexpected error sending notification: {e}")
+            logger.error("Discord API error sending notification: %s", e)
+        except Exception:
+            logger.exception("Unexpected error sending notification")
     
     def run(self):
         """
@@ -1407,27 +1929,85 @@ class StockAlertsBot:
                 "Please add your AWS Django API URL to the .env file:\n"
                 "DJANGO_API_URL=https://your-aws-domain.com"
             )
+
+        # Reject structurally invalid tokens here - a LoginFailure from
+        # Discord costs a full TLS handshake and REST round-trip just to
+        # learn the token was never going to work
+        if not re.fullmatch(r'[\w-]{20,}\.[\w-]{6,}\.[\w-]{20,}', self.bot_token):
+            raise ValueError(
+                "❌ DISCORD_BOT_TOKEN looks malformed!\n"
+                "Expected three dot-separated segments. Copy the full token\n"
+                "from the Discord Developer Portal into your .env file."
+            )
         
-        print("🚀 Starting Stock Alerts Discord Bot...")
-        print(f"🌐 API Endpoint: {self.django_api_url}")
-        print(f"🎯 Command Prefix: {self.bot_prefix}")
-        print("📝 Make sure your .env file is configured correctly!")
-        print("🔗 Invite the bot to your Discord server and start using it!")
-        print("-" * 60)
+        # One record through the queue logger - formatting and the
+        # stream write happen on the listener thread, not here
+        logger.info(
+            "🚀 Starting Stock Alerts Discord Bot...\n"
+            "🌐 API Endpoint: %s\n"
+            "🎯 Command Prefix: %s\n"
+            "📝 Make sure your .env file is configured correctly!\n"
+            "🔗 Invite the bot to your Discord server and start using it!",
+            self.django_api_url, self.bot_prefix
+        )
         
+        async def _main():
+            # Route SIGINT/SIGTERM through bot.close() on the loop: the
+            # gateway and writers shut down in milliseconds instead of
+            # unwinding through a KeyboardInterrupt teardown
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(
+                        sig, lambda: asyncio.create_task(self.bot.close())
+                    )
+                except NotImplementedError:
+                    # add_signal_handler isn't available on Windows;
+                    # Ctrl+C falls back to the KeyboardInterrupt path
+                    break
+
+            # Probe and warm up the Django HTTP path concurrently with
+            # the Discord login/gateway handshake instead of after it
+            try:
+                async with self.bot:
+                    await asyncio.gather(
+                        self._check_django(),
+                        self.bot.start(self.bot_token)
+                    )
+            finally:
+                # Clean up the shared HTTP session on shutdown
+                if self.session is not None and not self.session.closed:
+                    await self.session.close()
+
+        # Optional drop-in event loop in Cython on top of libuv - same
+        # asyncio API with a fraction of the per-iteration overhead, which
+        # is what a gateway-heartbeat-plus-small-HTTP workload spends its
+        # time on. Falls back silently to the stdlib loop.
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
+        # Manage the loop ourselves: bot.run() would build one internally,
+        # and owning it lets startup tasks share the gather above
+        loop = asyncio.new_event_loop()
         try:
-            # Run the bot (this blocks until the bot shuts down)
-            self.bot.run(self.bot_token)
+            loop.run_until_complete(_main())
         except discord.LoginFailure:
-            print("❌ Failed to login to Discord! Check your bot token.")
-        except Exception as e:
-            print(f"❌ Bot error: {e}")
+            logger.error("❌ Failed to login to Discord! Check your bot token.")
+        except Exception:
+            logger.exception("❌ Bot error")
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
 
 # Main execution
-if __name__ == "__main__":
-    print("=" * 60)
-    print("🤖 STOCK ALERTS DISCORD BOT")
-    print("=" * 60)
+def main():
+    """
+    Console entry point - used directly and by the zipapp build
+    """
+    logger.info("🤖 STOCK ALERTS DISCORD BOT")
     
     try:
         # Create and run the bot
@@ -1435,14 +2015,24 @@ if __name__ == "__main__":
         bot.run()
         
     except KeyboardInterrupt:
-        print("\n👋 Bot stopped by user")
+        logger.info("👋 Bot stopped by user")
     except Exception as e:
-        print(f"\n❌ Failed to start bot: {e}")
-        print("\n🔧 Please check:")
-        print("1. Your .env file exists and contains:")
-        print("   - DISCORD_BOT_TOKEN=your_bot_token")
-        print("   - DJANGO_API_URL=your_aws_url")
-        print("2. Your Discord bot token is correct")
-        print("3. Your AWS Django system is running and accessible")
-        print("4. All required packages are installed (discord.py, requests, python-dotenv)")
-        input("\nPress Enter to exit...")
\ No newline at end of file
+        sys.stderr.write(
+            f"\n❌ Failed to start bot: {e}\n"
+            "\n🔧 Please check:\n"
+            "1. Your .env file exists and contains:\n"
+            "   - DISCORD_BOT_TOKEN=your_bot_token\n"
+            "   - DJANGO_API_URL=your_aws_url\n"
+            "2. Your Discord bot token is correct\n"
+            "3. Your AWS Django system is running and accessible\n"
+            "4. All required packages are installed (discord.py, aiohttp, python-dotenv)\n"
+        )
+        # Only wait for a keypress on an interactive console; under
+        # systemd/Docker stdin is closed and input() would hang the
+        # failed process forever instead of letting it restart
+        if sys.stdin.isatty():
+            input("\nPress Enter to exit...")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file